@@ -1,7 +1,11 @@
 import logging
 import asyncio
-from collections.abc import Awaitable, Callable
-from typing import TypeVar
+import inspect
+import weakref
+from collections.abc import Awaitable, Callable, Iterable, Iterator, Sequence
+from functools import partial
+from itertools import repeat
+from typing import Any, NamedTuple, TypeVar
 
 from busify.views import BaseEvent
 
@@ -9,21 +13,128 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar("T", bound=BaseEvent)
 EventHandler = Callable[[T], Awaitable[None]]
+EventPredicate = Callable[[T], bool]
+_Dispatcher = Callable[[BaseEvent], Awaitable[None]]
+
+
+class _WeakHandler(weakref.WeakMethod):
+    """
+    Weak reference to a bound-method handler.
+    Hashes and compares by owner identity and function, so it works for
+    unhashable owners and matches a freshly created ref on unsubscribe.
+    """
+
+    __slots__ = ("_key",)
+
+    def __new__(cls, method: Any, callback: Callable[[Any], None] | None = None):
+        self = super().__new__(cls, method, callback)
+        self._key = (id(method.__self__), method.__func__)
+        return self
+
+    def __hash__(self) -> int:
+        return hash(self._key)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, _WeakHandler):
+            return self._key == other._key
+        return NotImplemented
+
+
+def _ref_handler(
+    handler: EventHandler, callback: Callable[[Any], None] | None = None
+) -> EventHandler | _WeakHandler:
+    if inspect.ismethod(handler):
+        try:
+            return _WeakHandler(handler, callback)
+        except TypeError:
+            # Owner does not support weak references.
+            pass
+    return handler
+
+
+def _live_handlers(
+    handlers: Iterable[EventHandler | _WeakHandler],
+) -> Iterator[EventHandler]:
+    """Yields the handlers, resolving weak ones and skipping collected owners."""
+    for handler in handlers:
+        if type(handler) is _WeakHandler:
+            handler = handler()
+            if handler is None:
+                continue
+        yield handler
+
+
+class _Subscription(NamedTuple):
+    predicate: EventPredicate | None = None
+    background: bool = False
+
+
+class _CacheEntry(NamedTuple):
+    handlers: tuple[EventHandler | _WeakHandler, ...]
+    subscriptions: tuple[_Subscription, ...] | None
+    dispatcher: _Dispatcher | None
+
+
+_DEFAULT_SUBSCRIPTION = _Subscription()
+_EMPTY: tuple = ()
 
 
 class EventBus:
-    def __init__(self):
-        self._handlers: dict[type[BaseEvent], list[EventHandler]] = {}
+    __slots__ = (
+        "_concurrent_dispatch",
+        "_handlers",
+        "_wildcard_handlers",
+        "_dispatch_cache",
+        "_waiters",
+        "_background_tasks",
+        "__weakref__",
+    )
+
+    def __init__(self, concurrent_dispatch: bool = False):
+        self._concurrent_dispatch = concurrent_dispatch
+        self._handlers: dict[
+            type[BaseEvent], dict[EventHandler | _WeakHandler, _Subscription]
+        ] = {}
         self._wildcard_handlers: list[Callable[[BaseEvent], Awaitable[None]]] = []
+        self._dispatch_cache: dict[type[BaseEvent], _CacheEntry] = {}
+        self._waiters: dict[
+            type[BaseEvent], list[tuple[asyncio.Future, EventPredicate | None]]
+        ] = {}
+        self._background_tasks: set[asyncio.Task] = set()
 
-    def subscribe(self, event_type: type[T], handler: EventHandler[T]) -> None:
-        self._handlers.setdefault(event_type, []).append(handler)
-        logger.debug(f"Subscribed to {event_type.__name__}")
+    def subscribe(
+        self,
+        event_type: type[T],
+        handler: EventHandler[T],
+        predicate: EventPredicate[T] | None = None,
+        background: bool = False,
+    ) -> None:
+        callback = self._gc_callback(event_type) if inspect.ismethod(handler) else None
+        ref = _ref_handler(handler, callback)
+        self._handlers.setdefault(event_type, {})[ref] = _Subscription(
+            predicate, background
+        )
+        self._dispatch_cache.clear()
+        logger.debug("Subscribed to %s", event_type.__name__)
 
     def unsubscribe(self, event_type: type[T], handler: EventHandler[T]) -> None:
-        if event_type in self._handlers:
-            if handler in self._handlers[event_type]:
-                self._handlers[event_type].remove(handler)
+        handlers = self._handlers.get(event_type)
+        ref = _ref_handler(handler)
+        if handlers is not None and ref in handlers:
+            del handlers[ref]
+            self._dispatch_cache.clear()
+
+    def _gc_callback(self, event_type: type[BaseEvent]) -> Callable[[Any], None]:
+        def callback(ref: _WeakHandler) -> None:
+            handlers = self._handlers.get(event_type)
+            if handlers is not None and handlers.pop(ref, None) is not None:
+                self._dispatch_cache.clear()
+                logger.debug(
+                    "Dropped %s handler after its owner was garbage collected",
+                    event_type.__name__,
+                )
+
+        return callback
 
     def unsubscribe_all(self, event_type: type[T] | None = None) -> None:
         if event_type is None:
@@ -31,26 +142,242 @@ class EventBus:
             self._wildcard_handlers.clear()
         elif event_type in self._handlers:
             del self._handlers[event_type]
+        self._dispatch_cache.clear()
 
-    async def dispatch(self, event: T) -> T:
-        event_type = type(event)
-        handlers = self._handlers.get(event_type, []) + self._wildcard_handlers
+    def _build_cache(self, event_type: type[BaseEvent]) -> _CacheEntry:
+        handlers, subscriptions = self._collect_handlers(event_type)
+        entry = _CacheEntry(
+            handlers, subscriptions, self._specialize(handlers, subscriptions)
+        )
+        self._dispatch_cache[event_type] = entry
+        return entry
+
+    def _collect_handlers(
+        self, event_type: type[BaseEvent]
+    ) -> tuple[
+        tuple[EventHandler | _WeakHandler, ...], tuple[_Subscription, ...] | None
+    ]:
+        """
+        Returns the handlers for an event type with their subscriptions.
+        Subscriptions are None when no handler needs filtering or scheduling
+        in the background; weak handlers are resolved by the runners.
+        """
+        subscribed = self._handlers.get(event_type)
+        if subscribed is None:
+            handlers = _EMPTY
+            subscriptions = _EMPTY
+        else:
+            handlers = tuple(subscribed)
+            subscriptions = tuple(subscribed.values())
+
+        if self._wildcard_handlers:
+            handlers += tuple(self._wildcard_handlers)
+            subscriptions += (_DEFAULT_SUBSCRIPTION,) * len(self._wildcard_handlers)
 
+        needs_selection = any(
+            subscription != _DEFAULT_SUBSCRIPTION for subscription in subscriptions
+        )
+        return handlers, subscriptions if needs_selection else None
+
+    def _specialize(
+        self,
+        handlers: tuple[EventHandler | _WeakHandler, ...],
+        subscriptions: tuple[_Subscription, ...] | None,
+    ) -> _Dispatcher | None:
+        """
+        Returns the cheapest dispatcher for the shape of an event type's
+        handlers, or None when there is nothing to run. A single plain handler
+        is returned as-is; dispatch records its failure itself.
+        """
+        if subscriptions is not None:
+            return partial(self._run_selected, handlers, subscriptions)
         if not handlers:
-            return event
+            return None
+        if len(handlers) == 1 and not isinstance(handlers[0], _WeakHandler):
+            return handlers[0]
+        if self._concurrent_dispatch:
+            return partial(self._run_concurrently, handlers)
+        return partial(self._run_sequentially, handlers)
+
+    def _select_handlers(
+        self,
+        handlers: tuple[EventHandler | _WeakHandler, ...],
+        subscriptions: tuple[_Subscription, ...],
+        event: BaseEvent,
+    ) -> tuple[list[EventHandler], list[EventHandler]]:
+        """Splits the live, matching handlers into awaited and background ones."""
+        selected = []
+        background = []
+        for handler, (predicate, in_background) in zip(handlers, subscriptions):
+            if isinstance(handler, _WeakHandler):
+                handler = handler()
+                if handler is None:
+                    continue
+            if predicate is not None:
+                try:
+                    if not predicate(event):
+                        continue
+                except Exception as e:
+                    self._record_failure(event, e)
+                    continue
+            (background if in_background else selected).append(handler)
+        return selected, background
+
+    def _record_failure(self, event: BaseEvent, exc: Exception) -> None:
+        logger.error(
+            "Handler failed for %s: %s",
+            type(event).__name__,
+            exc,
+            exc_info=exc,
+        )
+        event.set_exception(exc)
+
+    def _run_in_background(self, handler: EventHandler, event: BaseEvent) -> None:
+        task = asyncio.create_task(handler(event))
+        self._background_tasks.add(task)
+
+        def on_done(task: asyncio.Task) -> None:
+            self._background_tasks.discard(task)
+            if not task.cancelled() and task.exception() is not None:
+                self._record_failure(event, task.exception())
 
-        tasks = [handler(event) for handler in handlers]
+        task.add_done_callback(on_done)
+
+    async def _run_sequentially(
+        self, handlers: Sequence[EventHandler | _WeakHandler], event: BaseEvent
+    ) -> None:
+        for handler in handlers:
+            if type(handler) is _WeakHandler:
+                handler = handler()
+                if handler is None:
+                    continue
+            try:
+                await handler(event)
+            except Exception as e:
+                self._record_failure(event, e)
+
+    async def _run_concurrently(
+        self, handlers: Sequence[EventHandler | _WeakHandler], event: BaseEvent
+    ) -> None:
+        tasks = [handler(event) for handler in _live_handlers(handlers)]
         results = await asyncio.gather(*tasks, return_exceptions=True)
+        self._record_results(repeat(event), results)
+
+    def _record_results(
+        self, events: Iterable[BaseEvent], results: Iterable[Any]
+    ) -> None:
+        """Records gathered handler failures on the event each result belongs to."""
+        for event, result in zip(events, results):
+            # Handlers return None, so only failures need the isinstance check.
+            if result is not None and isinstance(result, Exception):
+                self._record_failure(event, result)
+
+    async def _run_selected(
+        self,
+        handlers: tuple[EventHandler | _WeakHandler, ...],
+        subscriptions: tuple[_Subscription, ...],
+        event: BaseEvent,
+    ) -> None:
+        selected, background = self._select_handlers(handlers, subscriptions, event)
+        for handler in background:
+            self._run_in_background(handler, event)
+
+        if self._concurrent_dispatch and len(selected) > 1:
+            await self._run_concurrently(selected, event)
+        else:
+            await self._run_sequentially(selected, event)
+
+    async def dispatch(self, event: T) -> T:
+        event_type = type(event)
+        try:
+            dispatcher = self._dispatch_cache[event_type].dispatcher
+        except KeyError:
+            dispatcher = self._build_cache(event_type).dispatcher
+
+        if dispatcher is not None:
+            try:
+                await dispatcher(event)
+            except Exception as e:
+                self._record_failure(event, e)
 
-        for result in results:
-            if isinstance(result, Exception):
+        if event_type in self._waiters:
+            self._resolve_waiters(event_type, event)
+
+        return event
+
+    async def dispatch_many(self, events: Iterable[T]) -> list[T]:
+        """
+        Dispatches several events at once and returns them in input order.
+        Events are grouped by type so each group's handlers come from the
+        dispatch cache once. Every handler call of the batch runs concurrently
+        in a single gather, even on a bus created with concurrent_dispatch=False,
+        so the handlers of one event run concurrently as well.
+        """
+        events = list(events)
+        groups: dict[type[BaseEvent], list[T]] = {}
+        for event in events:
+            groups.setdefault(type(event), []).append(event)
+
+        coros = []
+        owners = []
+        for event_type, group in groups.items():
+            try:
+                handlers, subscriptions, _ = self._dispatch_cache[event_type]
+            except KeyError:
+                handlers, subscriptions, _ = self._build_cache(event_type)
+
+            for event in group:
+                selected = handlers
+                if subscriptions is not None:
+                    selected, background = self._select_handlers(
+                        handlers, subscriptions, event
+                    )
+                    for handler in background:
+                        self._run_in_background(handler, event)
+
+                for handler in _live_handlers(selected):
+                    coros.append(handler(event))
+                    owners.append(event)
+
+        if coros:
+            results = await asyncio.gather(*coros, return_exceptions=True)
+            self._record_results(owners, results)
+
+        for event in events:
+            event_type = type(event)
+            if event_type in self._waiters:
+                self._resolve_waiters(event_type, event)
+
+        return events
+
+    def _resolve_waiters(self, event_type: type[BaseEvent], event: BaseEvent) -> None:
+        pending = []
+        for waiter in self._waiters[event_type]:
+            future, predicate = waiter
+            if future.done():
+                continue
+            try:
+                matched = predicate is None or predicate(event)
+            except Exception as e:
+                # Fail this waiter only; the remaining ones are still resolved.
                 logger.error(
-                    f"Handler failed for {event_type.__name__}: {result}",
-                    exc_info=result,
+                    "wait_for_event predicate failed for %s: %s",
+                    event_type.__name__,
+                    e,
+                    exc_info=e,
                 )
-                event.set_exception(result)
+                event.set_exception(e)
+                future.set_exception(e)
+                continue
+            if matched:
+                future.set_result(event)
+            else:
+                pending.append(waiter)
 
-        return event
+        if pending:
+            self._waiters[event_type] = pending
+        else:
+            del self._waiters[event_type]
 
     async def wait_for_event(
         self,
@@ -58,15 +385,11 @@ class EventBus:
         timeout: float | None = None,
         predicate: Callable[[T], bool] | None = None,
     ) -> T:
-        future: asyncio.Future[T] = asyncio.Future()
-        logger.debug(f"Waiting for {event_type.__name__} (timeout={timeout}s)")
+        future: asyncio.Future[T] = asyncio.get_running_loop().create_future()
+        logger.debug("Waiting for %s (timeout=%ss)", event_type.__name__, timeout)
 
-        async def handler(event: T) -> None:
-            if predicate is None or predicate(event):
-                if not future.done():
-                    future.set_result(event)
-
-        self.subscribe(event_type, handler)
+        waiter = (future, predicate)
+        self._waiters.setdefault(event_type, []).append(waiter)
 
         try:
             if timeout:
@@ -74,12 +397,25 @@ class EventBus:
             else:
                 result = await future
 
-            logger.debug(f"Received {event_type.__name__}")
+            logger.debug("Received %s", event_type.__name__)
             return result
         except asyncio.TimeoutError:
             logger.warning(
-                f"Timeout waiting for {event_type.__name__} after {timeout}s"
+                "Timeout waiting for %s after %ss", event_type.__name__, timeout
             )
             raise
         finally:
-            self.unsubscribe(event_type, handler)
\ No newline at end of file
+            # A resolved waiter was already popped by _resolve_waiters.
+            if future.cancelled() or not future.done():
+                self._remove_waiter(event_type, waiter)
+
+    def _remove_waiter(
+        self,
+        event_type: type[BaseEvent],
+        waiter: tuple[asyncio.Future, EventPredicate | None],
+    ) -> None:
+        waiters = self._waiters.get(event_type)
+        if waiters is not None and waiter in waiters:
+            waiters.remove(waiter)
+            if not waiters:
+                del self._waiters[event_type]
\ No newline at end of file
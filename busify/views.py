@@ -1,53 +1,74 @@
 import asyncio
-from typing import Generic, TypeVar
+import os
+from typing import Any, Generic, TypeVar
 from dataclasses import dataclass, field
 
 
 import time
-from uuid import uuid4
 
 ResultT = TypeVar("ResultT")
 
+_PENDING = 0
+_DONE = 1
+_ERROR = 2
 
-@dataclass(kw_only=True, frozen=True)
+
+def _new_event_id() -> str:
+    """Returns a random 128-bit hex id without building a UUID object."""
+    return os.urandom(16).hex()
+
+
+@dataclass(kw_only=True, frozen=True, slots=True, weakref_slot=True)
 class BaseEvent(Generic[ResultT]):
     """
     Base event class for all events.
     Events can optionally have a result of type ResultT.
     """
 
-    id: str = field(default_factory=lambda: str(uuid4()))
+    id: str = field(default_factory=_new_event_id)
     timestamp: float = field(default_factory=time.time)
-    _result: ResultT | None = field(init=False, default=None, repr=False, compare=False)
-    _completed: bool = field(init=False, default=False, repr=False, compare=False)
-
-    _exception: Exception | None = field(
-        init=False, default=None, repr=False, compare=False
+    # (status, payload): the payload is the result when done, the exception on error.
+    # default_factory makes __init__ assign the field, which subclasses that
+    # are not slotted themselves rely on.
+    _state: tuple[int, Any] = field(
+        init=False, default_factory=lambda: (_PENDING, None), repr=False, compare=False
+    )
+    _done: asyncio.Event | None = field(
+        init=False, default_factory=lambda: None, repr=False, compare=False
     )
 
     @property
     def is_completed(self) -> bool:
-        return self._completed
+        return self._state[0] != _PENDING
 
     @property
     def has_error(self) -> bool:
-        return self._exception is not None
-    
+        return self._state[0] == _ERROR
+
+    def _get_done(self) -> asyncio.Event:
+        """Returns the completion signal, creating it on first use."""
+        if self._done is None:
+            done = asyncio.Event()
+            if self._state[0] != _PENDING:
+                done.set()
+            object.__setattr__(self, "_done", done)
+        return self._done
+
     def __await__(self):
         async def _wait():
-            while not self._completed:
-                await asyncio.sleep(0.01)
+            await self._get_done().wait()
             return self.get_result(raise_if_exception=True)
-        
+
         return _wait().__await__()
 
     def set_result(self, value: ResultT) -> None:
         """Sets the result, bypassing the frozen state."""
-        if self._completed:
+        if self._state[0] != _PENDING:
             raise RuntimeError("Event already completed")
 
-        object.__setattr__(self, "_result", value)
-        object.__setattr__(self, "_completed", True)
+        object.__setattr__(self, "_state", (_DONE, value))
+        if self._done is not None:
+            self._done.set()
 
     def get_result(
         self, raise_if_none: bool = False, raise_if_exception: bool = True
@@ -59,17 +80,24 @@ class BaseEvent(Generic[ResultT]):
             raise_if_none: If True, raises ValueError if the event is not completed yet.
             raise_if_exception: If True, raises the stored exception if one exists.
         """
-        if raise_if_exception and self._exception is not None:
-            raise self._exception
+        status, payload = self._state
+        if status == _DONE:
+            return payload
+
+        if status == _ERROR:
+            if raise_if_exception:
+                raise payload
+            return None
 
-        if raise_if_none and not self._completed:
+        if raise_if_none:
             raise ValueError(f"Event {self.__class__.__name__} has not completed yet")
 
-        return self._result
+        return None
 
     def set_exception(self, exc: Exception) -> None:
-        if self._completed:
+        if self._state[0] != _PENDING:
             return
 
-        object.__setattr__(self, "_exception", exc)
-        object.__setattr__(self, "_completed", True)
+        object.__setattr__(self, "_state", (_ERROR, exc))
+        if self._done is not None:
+            self._done.set()
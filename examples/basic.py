@@ -11,13 +11,13 @@ DELAYED_EVENT_DELAY = 1.0
 EVENT_TIMEOUT = 5.0
 
 
-@dataclass(kw_only=True, frozen=True)
+@dataclass(kw_only=True, frozen=True, slots=True)
 class UserRegistered(BaseEvent[str]):
     username: str
     email: str
 
 
-@dataclass(kw_only=True, frozen=True)
+@dataclass(kw_only=True, frozen=True, slots=True)
 class OrderPlaced(BaseEvent[dict]):
     order_id: str
     amount: float
@@ -102,7 +102,8 @@ async def demonstrate_awaitable_event(bus: EventBus) -> None:
 
 
 def setup_event_bus() -> EventBus:
-    bus = EventBus()
+    # Run the email and profile handlers side by side instead of one after another.
+    bus = EventBus(concurrent_dispatch=True)
     bus.subscribe(UserRegistered, send_welcome_email)
     bus.subscribe(UserRegistered, create_user_profile)
     bus.subscribe(OrderPlaced, process_payment)
@@ -1,18 +1,25 @@
+import asyncio
+import weakref
 import pytest
 from dataclasses import dataclass
 from busify import BaseEvent
 
 
-@dataclass(kw_only=True, frozen=True)
+@dataclass(kw_only=True, frozen=True, slots=True)
 class TestEvent(BaseEvent[str]):
     data: str
 
 
-@dataclass(kw_only=True, frozen=True)
+@dataclass(kw_only=True, frozen=True, slots=True)
 class NoResultEvent(BaseEvent[None]):
     value: int
 
 
+@dataclass(kw_only=True, frozen=True)
+class PlainEvent(BaseEvent[str]):
+    data: str
+
+
 def test_event_creation():
     event = TestEvent(data="test")
     assert event.data == "test"
@@ -62,4 +69,73 @@ def test_get_exception_without_raise():
     event.set_exception(ValueError("test"))
     
     result = event.get_result(raise_if_exception=False)
-    assert result is None
\ No newline at end of file
+    assert result is None
+
+
+@pytest.mark.asyncio
+async def test_await_returns_result_once_set():
+    event = TestEvent(data="test")
+
+    async def complete_later():
+        await asyncio.sleep(0)
+        event.set_result("done")
+
+    task = asyncio.create_task(complete_later())
+    assert await event == "done"
+    await task
+
+
+@pytest.mark.asyncio
+async def test_await_raises_stored_exception():
+    event = TestEvent(data="test")
+    event.set_exception(ValueError("boom"))
+
+    with pytest.raises(ValueError, match="boom"):
+        await event
+
+
+def test_event_has_no_instance_dict():
+    event = TestEvent(data="test")
+    assert not hasattr(event, "__dict__")
+
+
+def test_event_ids_are_unique():
+    ids = {TestEvent(data="test").id for _ in range(1000)}
+    assert len(ids) == 1000
+
+
+@pytest.mark.asyncio
+async def test_await_already_completed_event():
+    event = TestEvent(data="test")
+    event.set_result("done")
+
+    assert await event == "done"
+
+
+def test_event_supports_weak_references():
+    event = TestEvent(data="test")
+    assert weakref.ref(event)() is event
+
+
+@pytest.mark.asyncio
+async def test_plain_subclass_without_slots():
+    event = PlainEvent(data="test")
+    assert not event.is_completed
+
+    async def complete_later():
+        await asyncio.sleep(0)
+        event.set_result("done")
+
+    task = asyncio.create_task(complete_later())
+    assert await event == "done"
+    await task
+    assert event.is_completed
+
+
+def test_plain_subclass_records_exception():
+    event = PlainEvent(data="test")
+    event.set_exception(ValueError("boom"))
+
+    assert event.has_error
+    with pytest.raises(ValueError, match="boom"):
+        event.get_result()
@@ -1,16 +1,19 @@
 import pytest
+import gc
+import inspect
+import weakref
 import asyncio
 from dataclasses import dataclass
 from busify import EventBus, BaseEvent
 
 
-@dataclass(kw_only=True, frozen=True)
+@dataclass(kw_only=True, frozen=True, slots=True)
 class UserCreatedEvent(BaseEvent[None]):
     user_id: str
     email: str
 
 
-@dataclass(kw_only=True, frozen=True)
+@dataclass(kw_only=True, frozen=True, slots=True)
 class OrderPlacedEvent(BaseEvent[dict]):
     order_id: str
     amount: float
@@ -191,4 +194,534 @@ async def test_event_with_result(bus):
     
     result = event.get_result()
     assert result["status"] == "processed"
-    assert result["order_id"] == "456"
\ No newline at end of file
+    assert result["order_id"] == "456"
+
+
+@pytest.mark.asyncio
+async def test_subscribe_after_dispatch_is_picked_up(bus):
+    received = []
+
+    async def handler1(event: UserCreatedEvent):
+        received.append(1)
+
+    async def handler2(event: UserCreatedEvent):
+        received.append(2)
+
+    bus.subscribe(UserCreatedEvent, handler1)
+    await bus.dispatch(UserCreatedEvent(user_id="123", email="test@example.com"))
+
+    bus.subscribe(UserCreatedEvent, handler2)
+    await bus.dispatch(UserCreatedEvent(user_id="456", email="test@example.com"))
+
+    bus.unsubscribe(UserCreatedEvent, handler1)
+    await bus.dispatch(UserCreatedEvent(user_id="789", email="test@example.com"))
+
+    assert sorted(received) == [1, 1, 2, 2]
+
+
+@pytest.mark.asyncio
+async def test_handlers_run_in_subscription_order(bus):
+    call_order = []
+
+    def make_handler(i: int):
+        async def handler(event: UserCreatedEvent):
+            call_order.append(i)
+
+        return handler
+
+    handlers = [make_handler(i) for i in range(5)]
+    for handler in handlers:
+        bus.subscribe(UserCreatedEvent, handler)
+    bus.unsubscribe(UserCreatedEvent, handlers[2])
+
+    await bus.dispatch(UserCreatedEvent(user_id="123", email="test@example.com"))
+
+    assert call_order == [0, 1, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_subscribe_with_predicate(bus):
+    received = []
+
+    async def handler(event: UserCreatedEvent):
+        received.append(event.user_id)
+
+    bus.subscribe(UserCreatedEvent, handler, predicate=lambda e: e.user_id == "123")
+
+    await bus.dispatch(UserCreatedEvent(user_id="123", email="test@example.com"))
+    await bus.dispatch(UserCreatedEvent(user_id="456", email="test@example.com"))
+
+    assert received == ["123"]
+
+
+@pytest.mark.asyncio
+async def test_wait_for_event_does_not_touch_handlers(bus):
+    async def emit_event():
+        await asyncio.sleep(0.05)
+        assert UserCreatedEvent not in bus._handlers
+        await bus.dispatch(UserCreatedEvent(user_id="123", email="test@example.com"))
+
+    asyncio.create_task(emit_event())
+
+    event = await bus.wait_for_event(UserCreatedEvent, timeout=1.0)
+    assert event.user_id == "123"
+    assert UserCreatedEvent not in bus._waiters
+
+
+@pytest.mark.asyncio
+async def test_wait_for_event_sees_handler_result(bus):
+    async def handler(event: OrderPlacedEvent):
+        event.set_result({"status": "processed"})
+
+    bus.subscribe(OrderPlacedEvent, handler)
+
+    async def emit_event():
+        await asyncio.sleep(0.05)
+        await bus.dispatch(OrderPlacedEvent(order_id="456", amount=99.99))
+
+    asyncio.create_task(emit_event())
+
+    event = await bus.wait_for_event(OrderPlacedEvent, timeout=1.0)
+    assert event.get_result() == {"status": "processed"}
+
+
+@pytest.mark.asyncio
+async def test_bound_method_handler_does_not_keep_owner_alive(bus):
+    received = []
+
+    class Listener:
+        async def on_user_created(self, event: UserCreatedEvent):
+            received.append(event)
+
+    listener = Listener()
+    bus.subscribe(UserCreatedEvent, listener.on_user_created)
+    await bus.dispatch(UserCreatedEvent(user_id="123", email="test@example.com"))
+
+    del listener
+    gc.collect()
+    await bus.dispatch(UserCreatedEvent(user_id="456", email="test@example.com"))
+
+    assert len(received) == 1
+    assert not bus._handlers[UserCreatedEvent]
+
+
+@pytest.mark.asyncio
+async def test_unsubscribe_bound_method(bus):
+    received = []
+
+    @dataclass
+    class Listener:
+        name: str
+
+        async def on_user_created(self, event: UserCreatedEvent):
+            received.append(self.name)
+
+    listener = Listener(name="a")
+    bus.subscribe(UserCreatedEvent, listener.on_user_created)
+    bus.unsubscribe(UserCreatedEvent, listener.on_user_created)
+
+    await bus.dispatch(UserCreatedEvent(user_id="123", email="test@example.com"))
+
+    assert received == []
+
+
+@pytest.mark.asyncio
+async def test_handlers_run_sequentially_by_default(bus):
+    call_order = []
+
+    async def slow_handler(event: UserCreatedEvent):
+        await asyncio.sleep(0.05)
+        call_order.append("slow")
+
+    async def fast_handler(event: UserCreatedEvent):
+        call_order.append("fast")
+
+    bus.subscribe(UserCreatedEvent, slow_handler)
+    bus.subscribe(UserCreatedEvent, fast_handler)
+
+    await bus.dispatch(UserCreatedEvent(user_id="123", email="test@example.com"))
+
+    assert call_order == ["slow", "fast"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_dispatch_runs_handlers_together():
+    bus = EventBus(concurrent_dispatch=True)
+    call_order = []
+
+    async def slow_handler(event: UserCreatedEvent):
+        await asyncio.sleep(0.05)
+        call_order.append("slow")
+
+    async def fast_handler(event: UserCreatedEvent):
+        call_order.append("fast")
+
+    bus.subscribe(UserCreatedEvent, slow_handler)
+    bus.subscribe(UserCreatedEvent, fast_handler)
+
+    await bus.dispatch(UserCreatedEvent(user_id="123", email="test@example.com"))
+
+    assert call_order == ["fast", "slow"]
+
+
+@pytest.mark.asyncio
+async def test_background_handler_does_not_block_dispatch(bus):
+    finished = asyncio.Event()
+
+    async def background_handler(event: UserCreatedEvent):
+        await asyncio.sleep(0.05)
+        finished.set()
+        raise ValueError("Background failure")
+
+    bus.subscribe(UserCreatedEvent, background_handler, background=True)
+
+    event = UserCreatedEvent(user_id="123", email="test@example.com")
+    await bus.dispatch(event)
+    assert not finished.is_set()
+
+    await asyncio.wait_for(finished.wait(), timeout=1.0)
+    await asyncio.sleep(0)
+    assert event.has_error
+
+
+@pytest.mark.asyncio
+async def test_wait_for_event_is_one_shot(bus):
+    waiter = asyncio.create_task(bus.wait_for_event(UserCreatedEvent, timeout=1.0))
+    await asyncio.sleep(0)
+
+    first = UserCreatedEvent(user_id="1", email="test@example.com")
+    await bus.dispatch(first)
+    assert UserCreatedEvent not in bus._waiters
+
+    await bus.dispatch(UserCreatedEvent(user_id="2", email="test@example.com"))
+    assert await waiter is first
+
+
+@pytest.mark.asyncio
+async def test_wait_for_event_timeout_removes_waiter(bus):
+    with pytest.raises(asyncio.TimeoutError):
+        await bus.wait_for_event(UserCreatedEvent, timeout=0.05)
+
+    assert UserCreatedEvent not in bus._waiters
+
+
+def test_event_bus_has_no_instance_dict(bus):
+    assert not hasattr(bus, "__dict__")
+
+
+@pytest.mark.asyncio
+async def test_dispatch_many(bus):
+    received = []
+
+    async def user_handler(event: UserCreatedEvent):
+        received.append(event.user_id)
+
+    async def order_handler(event: OrderPlacedEvent):
+        if event.amount < 0:
+            raise ValueError("Negative amount")
+        event.set_result({"order_id": event.order_id})
+
+    bus.subscribe(UserCreatedEvent, user_handler)
+    bus.subscribe(OrderPlacedEvent, order_handler)
+
+    events = [
+        UserCreatedEvent(user_id="1", email="a@example.com"),
+        OrderPlacedEvent(order_id="A", amount=10.0),
+        UserCreatedEvent(user_id="2", email="b@example.com"),
+        OrderPlacedEvent(order_id="B", amount=-1.0),
+    ]
+    dispatched = await bus.dispatch_many(events)
+
+    assert dispatched == events
+    assert sorted(received) == ["1", "2"]
+    assert events[1].get_result() == {"order_id": "A"}
+    assert events[3].has_error
+    assert not events[0].has_error
+
+
+def test_event_bus_supports_weak_references(bus):
+    assert weakref.ref(bus)() is bus
+
+
+@pytest.mark.asyncio
+async def test_failing_predicate_does_not_stop_other_handlers(bus):
+    received = []
+
+    async def handler_a(event: UserCreatedEvent):
+        received.append("a")
+
+    async def handler_b(event: UserCreatedEvent):
+        received.append("b")
+
+    bus.subscribe(UserCreatedEvent, handler_a)
+    bus.subscribe(UserCreatedEvent, handler_b, predicate=lambda e: 1 / 0)
+
+    event = UserCreatedEvent(user_id="123", email="test@example.com")
+    await bus.dispatch(event)
+
+    assert received == ["a"]
+    assert event.has_error
+
+
+@pytest.mark.asyncio
+async def test_failing_wait_for_event_predicate(bus, caplog):
+    failing = asyncio.create_task(
+        bus.wait_for_event(UserCreatedEvent, predicate=lambda e: 1 / 0, timeout=1.0)
+    )
+    working = asyncio.create_task(bus.wait_for_event(UserCreatedEvent, timeout=1.0))
+    await asyncio.sleep(0)
+
+    event = UserCreatedEvent(user_id="123", email="test@example.com")
+    await bus.dispatch(event)
+
+    assert event.has_error
+    assert "wait_for_event predicate failed" in caplog.text
+    assert "Handler failed" not in caplog.text
+    assert await working is event
+    with pytest.raises(ZeroDivisionError):
+        await failing
+    assert UserCreatedEvent not in bus._waiters
+
+
+@pytest.mark.asyncio
+async def test_concurrent_dispatch_allows_handlers_to_await_siblings():
+    bus = EventBus(concurrent_dispatch=True)
+    seen = []
+
+    async def waiting_handler(event: OrderPlacedEvent):
+        seen.append(await event)
+
+    async def completing_handler(event: OrderPlacedEvent):
+        event.set_result({"status": "processed"})
+
+    bus.subscribe(OrderPlacedEvent, waiting_handler)
+    bus.subscribe(OrderPlacedEvent, completing_handler)
+
+    event = OrderPlacedEvent(order_id="456", amount=99.99)
+    await asyncio.wait_for(bus.dispatch(event), timeout=1.0)
+
+    assert seen == [{"status": "processed"}]
+
+
+def test_dispatch_is_a_coroutine_function():
+    assert inspect.iscoroutinefunction(EventBus.dispatch)
+
+
+@pytest.mark.asyncio
+async def test_handlers_are_resolved_when_dispatch_is_awaited(bus):
+    received = []
+
+    async def handler(event: UserCreatedEvent):
+        received.append(event)
+
+    coro = bus.dispatch(UserCreatedEvent(user_id="123", email="test@example.com"))
+    bus.subscribe(UserCreatedEvent, handler)
+    await coro
+
+    assert len(received) == 1
+
+
+@pytest.mark.asyncio
+async def test_dispatch_shape_is_rebuilt_on_subscription_changes(bus):
+    received = []
+
+    async def handler1(event: UserCreatedEvent):
+        received.append(("1", event.user_id))
+
+    async def handler2(event: UserCreatedEvent):
+        received.append(("2", event.user_id))
+
+    async def failing_handler(event: UserCreatedEvent):
+        raise ValueError("Fail")
+
+    empty = UserCreatedEvent(user_id="a", email="test@example.com")
+    await bus.dispatch(empty)
+
+    bus.subscribe(UserCreatedEvent, handler1)
+    await bus.dispatch(UserCreatedEvent(user_id="b", email="test@example.com"))
+
+    bus.subscribe(UserCreatedEvent, handler2)
+    await bus.dispatch(UserCreatedEvent(user_id="c", email="test@example.com"))
+
+    bus.subscribe(UserCreatedEvent, handler2, predicate=lambda e: e.user_id == "e")
+    await bus.dispatch(UserCreatedEvent(user_id="d", email="test@example.com"))
+    await bus.dispatch(UserCreatedEvent(user_id="e", email="test@example.com"))
+
+    bus.unsubscribe_all(UserCreatedEvent)
+    bus.subscribe(UserCreatedEvent, failing_handler)
+    failed = UserCreatedEvent(user_id="f", email="test@example.com")
+    await bus.dispatch(failed)
+
+    assert received == [
+        ("1", "b"),
+        ("1", "c"),
+        ("2", "c"),
+        ("1", "d"),
+        ("1", "e"),
+        ("2", "e"),
+    ]
+    assert not empty.has_error
+    assert failed.has_error
+
+
+@pytest.mark.asyncio
+async def test_concurrent_dispatch_records_each_failure():
+    bus = EventBus(concurrent_dispatch=True)
+    received = []
+
+    async def failing_handler(event: UserCreatedEvent):
+        raise ValueError("Fail")
+
+    async def working_handler(event: UserCreatedEvent):
+        received.append(event)
+
+    bus.subscribe(UserCreatedEvent, failing_handler)
+    bus.subscribe(UserCreatedEvent, working_handler)
+
+    event = UserCreatedEvent(user_id="123", email="test@example.com")
+    await bus.dispatch(event)
+
+    assert len(received) == 1
+    assert event.has_error
+
+
+@pytest.mark.asyncio
+async def test_single_bound_method_handler_lifecycle(bus):
+    received = []
+
+    class Listener:
+        async def on_user_created(self, event: UserCreatedEvent):
+            received.append(event.user_id)
+
+    listener = Listener()
+    bus.subscribe(UserCreatedEvent, listener.on_user_created)
+    await bus.dispatch(UserCreatedEvent(user_id="1", email="test@example.com"))
+    await bus.dispatch(UserCreatedEvent(user_id="2", email="test@example.com"))
+
+    del listener
+    gc.collect()
+    event = UserCreatedEvent(user_id="3", email="test@example.com")
+    await bus.dispatch(event)
+
+    assert received == ["1", "2"]
+    assert not event.has_error
+
+
+@pytest.mark.asyncio
+async def test_bound_method_of_temporary_object_is_dropped(bus, caplog):
+    received = []
+
+    class Listener:
+        async def on_user_created(self, event: UserCreatedEvent):
+            received.append(event)
+
+    # Nothing else references the listener, so the subscription is a no-op.
+    with caplog.at_level("DEBUG", logger="busify.bus"):
+        bus.subscribe(UserCreatedEvent, Listener().on_user_created)
+        gc.collect()
+
+    await bus.dispatch(UserCreatedEvent(user_id="123", email="test@example.com"))
+
+    assert received == []
+    assert "garbage collected" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_dispatch_many_resolves_waiters(bus):
+    waiter = asyncio.create_task(
+        bus.wait_for_event(
+            UserCreatedEvent, predicate=lambda e: e.user_id == "2", timeout=1.0
+        )
+    )
+    await asyncio.sleep(0)
+
+    events = [
+        UserCreatedEvent(user_id="1", email="a@example.com"),
+        UserCreatedEvent(user_id="2", email="b@example.com"),
+    ]
+    await bus.dispatch_many(events)
+
+    assert await waiter is events[1]
+
+
+@pytest.mark.asyncio
+async def test_dispatch_many_applies_predicates(bus):
+    received = []
+
+    async def handler(event: UserCreatedEvent):
+        received.append(event.user_id)
+
+    bus.subscribe(UserCreatedEvent, handler, predicate=lambda e: e.user_id != "2")
+
+    await bus.dispatch_many(
+        UserCreatedEvent(user_id=user_id, email="test@example.com")
+        for user_id in ("1", "2", "3")
+    )
+
+    assert sorted(received) == ["1", "3"]
+
+
+@pytest.mark.asyncio
+async def test_dispatch_many_schedules_background_handlers(bus):
+    finished = asyncio.Event()
+    received = []
+
+    async def background_handler(event: UserCreatedEvent):
+        await asyncio.sleep(0.05)
+        received.append(event.user_id)
+        finished.set()
+
+    bus.subscribe(UserCreatedEvent, background_handler, background=True)
+
+    await bus.dispatch_many([UserCreatedEvent(user_id="1", email="a@example.com")])
+    assert received == []
+
+    await asyncio.wait_for(finished.wait(), timeout=1.0)
+    assert received == ["1"]
+
+
+@pytest.mark.asyncio
+async def test_dispatch_many_runs_handlers_concurrently_on_sequential_bus(bus):
+    call_order = []
+
+    async def slow_handler(event: UserCreatedEvent):
+        await asyncio.sleep(0.05)
+        call_order.append("slow")
+
+    async def fast_handler(event: UserCreatedEvent):
+        call_order.append("fast")
+
+    bus.subscribe(UserCreatedEvent, slow_handler)
+    bus.subscribe(UserCreatedEvent, fast_handler)
+
+    await bus.dispatch_many([UserCreatedEvent(user_id="1", email="a@example.com")])
+
+    assert call_order == ["fast", "slow"]
+
+
+@pytest.mark.asyncio
+async def test_subscribing_same_handler_twice_registers_it_once(bus):
+    call_order = []
+
+    async def handler1(event: UserCreatedEvent):
+        call_order.append(("1", event.user_id))
+
+    async def handler2(event: UserCreatedEvent):
+        call_order.append(("2", event.user_id))
+
+    bus.subscribe(UserCreatedEvent, handler1)
+    bus.subscribe(UserCreatedEvent, handler2)
+    bus.subscribe(UserCreatedEvent, handler1)
+    await bus.dispatch(UserCreatedEvent(user_id="a", email="test@example.com"))
+
+    bus.subscribe(UserCreatedEvent, handler1, predicate=lambda e: e.user_id == "c")
+    await bus.dispatch(UserCreatedEvent(user_id="b", email="test@example.com"))
+    await bus.dispatch(UserCreatedEvent(user_id="c", email="test@example.com"))
+
+    assert call_order == [
+        ("1", "a"),
+        ("2", "a"),
+        ("2", "b"),
+        ("1", "c"),
+        ("2", "c"),
+    ]